@@ -50,12 +50,17 @@ export function activate(context: vscode.ExtensionContext) {
 
 	context.subscriptions.push(checkVenv);
 
+	// The import check starts a Python interpreter that loads the CLI and its
+	// CodeCarbon dependency, so only pay for it once per venv per session.
+	let verifiedPythonPath: string | undefined;
+
 	const installReq = vscode.commands.registerCommand(
 		'pygreensense-extension.installRequirements',
 		async () => {
 			output.clear();
 			output.show(true);
 			output.appendLine('=== Installing Extension Requirements ===');
+			verifiedPythonPath = undefined;
 
 			try {
 				await installExtensionRequirements(context, output);
@@ -81,16 +86,20 @@ export function activate(context: vscode.ExtensionContext) {
 			output.appendLine(`venv python: ${pythonPath}`);
 			output.appendLine(`history storage: ${globalStoragePath}`);
 
-			const check = await runInVenv(
-				pythonPath,
-				['-c', `from ${PYGREENSENSE_CLI_MODULE} import main; print("pygreensense cli import ok")`],
-				workspaceRoot,
-				output
-			);
+			if (verifiedPythonPath !== pythonPath) {
+				const check = await runInVenv(
+					pythonPath,
+					['-c', `from ${PYGREENSENSE_CLI_MODULE} import main; print("pygreensense cli import ok")`],
+					workspaceRoot,
+					output
+				);
 
-			if (check.code !== 0) {
-				vscode.window.showErrorMessage('PyGreenSense CLI is not importable in the extension venv.');
-				return;
+				if (check.code !== 0) {
+					vscode.window.showErrorMessage('PyGreenSense CLI is not importable in the extension venv.');
+					return;
+				}
+
+				verifiedPythonPath = pythonPath;
 			}
 
 			prepareHistoryForRun(workspaceRoot, globalStoragePath);
@@ -113,6 +122,7 @@ export function activate(context: vscode.ExtensionContext) {
 			});
 
 			if (result.code !== 0) {
+				verifiedPythonPath = undefined;
 				vscode.window.showErrorMessage('PyGreenSense failed. See Output → PyGreenSense.');
 				return;
 			}
@@ -141,6 +151,11 @@ export function activate(context: vscode.ExtensionContext) {
 				return;
 			}
 
+			if (editor.document.languageId !== 'python') {
+				vscode.window.showErrorMessage('PyGreenSense can only analyze Python files.');
+				return;
+			}
+
 			const targetFile = editor.document.uri.fsPath;
 			const workspaceRoot = vscode.workspace.getWorkspaceFolder(editor.document.uri)?.uri.fsPath;
 			if (!workspaceRoot) {
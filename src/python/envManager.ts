@@ -15,8 +15,10 @@ function run(cmd: string, args: string[], cwd: string, output: vscode.OutputChan
 
         const p = spawn(cmd, args, { cwd });
 
-        p.stdout.on('data', (d) => output.appendLine(String(d)));
-        p.stderr.on('data', (d) => output.appendLine(String(d)));
+        p.stdout.setEncoding('utf8');
+        p.stderr.setEncoding('utf8');
+        p.stdout.on('data', (s: string) => output.append(s));
+        p.stderr.on('data', (s: string) => output.append(s));
 
         p.on('error', reject);
         p.on('close', (code) => {
@@ -31,7 +33,8 @@ function run(cmd: string, args: string[], cwd: string, output: vscode.OutputChan
 
 function commandExists(cmd: string, args: string[], cwd: string): Promise<boolean> {
     return new Promise((resolve) => {
-        const p = spawn(cmd, args, { cwd });
+        // Only the exit code matters; discard output instead of piping it back unread.
+        const p = spawn(cmd, args, { cwd, stdio: 'ignore' });
 
         p.on('error', () => resolve(false));
         p.on('close', (code) => resolve(code === 0));
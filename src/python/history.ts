@@ -45,21 +45,35 @@ function fileExists(filePath: string): boolean {
   return fs.existsSync(filePath);
 }
 
+function isMissingFileError(error: any): boolean {
+  return error?.code === 'ENOENT';
+}
+
 function copyFile(sourcePath: string, destinationPath: string): void {
   ensureDir(path.dirname(destinationPath));
   fs.copyFileSync(sourcePath, destinationPath);
 }
 
 function moveFile(sourcePath: string, destinationPath: string): void {
-  copyFile(sourcePath, destinationPath);
-  fs.unlinkSync(sourcePath);
+  ensureDir(path.dirname(destinationPath));
+
+  try {
+    // A rename avoids rewriting the whole history file on every run.
+    fs.renameSync(sourcePath, destinationPath);
+  } catch (error: any) {
+    if (error?.code !== 'EXDEV') {
+      throw error;
+    }
+
+    // Workspace and global storage live on different devices.
+    fs.copyFileSync(sourcePath, destinationPath);
+    fs.unlinkSync(sourcePath);
+  }
 }
 
 function tryReadJson(filePath: string): any | null {
   try {
-    if (!fileExists(filePath)) {
-      return null;
-    }
+    // A missing file surfaces as ENOENT here, so no separate existence probe is needed.
     const raw = fs.readFileSync(filePath, 'utf8');
     return JSON.parse(raw);
   } catch {
@@ -92,8 +106,12 @@ export function prepareHistoryForRun(workspaceRoot: string, globalStoragePath: s
   const workspaceHistoryPath = getWorkspaceHistoryPath(workspaceRoot);
   const globalHistoryPath = getGlobalHistoryPath(globalStoragePath);
 
-  if (fileExists(globalHistoryPath)) {
+  try {
     copyFile(globalHistoryPath, workspaceHistoryPath);
+  } catch (error) {
+    if (!isMissingFileError(error)) {
+      throw error;
+    }
   }
 }
 
@@ -101,11 +119,17 @@ export function persistHistoryAfterRun(workspaceRoot: string, globalStoragePath:
   const workspaceHistoryPath = getWorkspaceHistoryPath(workspaceRoot);
   const globalHistoryPath = getGlobalHistoryPath(globalStoragePath);
 
-  if (!fileExists(workspaceHistoryPath)) {
+  try {
+    moveFile(workspaceHistoryPath, globalHistoryPath);
+  } catch (error) {
+    if (!isMissingFileError(error)) {
+      throw error;
+    }
+
+    // The run did not write a workspace history file.
     return fileExists(globalHistoryPath) ? globalHistoryPath : null;
   }
 
-  moveFile(workspaceHistoryPath, globalHistoryPath);
   return globalHistoryPath;
 }
 
@@ -23,23 +23,33 @@ export async function runInVenv(
     output.appendLine(`$ ${pythonPath} ${args.join(' ')}`);
     const p = spawn(pythonPath, args, { cwd });
 
-    let stdout = '';
-    let stderr = '';
+    const stdoutChunks: string[] = [];
+    const stderrChunks: string[] = [];
 
-    p.stdout.on('data', (d) => {
-      const s = String(d);
-      stdout += s;
-      output.appendLine(s);
+    // Decode once at the stream level so multi-byte characters (the report
+    // uses emoji markers) are never split across chunk boundaries.
+    p.stdout.setEncoding('utf8');
+    p.stderr.setEncoding('utf8');
+
+    // Chunks already carry their own line endings, so forward them verbatim.
+    p.stdout.on('data', (s: string) => {
+      stdoutChunks.push(s);
+      output.append(s);
     });
 
-    p.stderr.on('data', (d) => {
-      const s = String(d);
-      stderr += s;
-      output.appendLine(s);
+    p.stderr.on('data', (s: string) => {
+      stderrChunks.push(s);
+      output.append(s);
     });
 
     p.on('error', reject);
-    p.on('close', (code) => resolve({ code: code ?? -1, stdout, stderr }));
+    p.on('close', (code) =>
+      resolve({
+        code: code ?? -1,
+        stdout: stdoutChunks.join(''),
+        stderr: stderrChunks.join(''),
+      })
+    );
   });
 }
 
@@ -36,8 +36,9 @@ export function getExtensionVenvPaths(context: vscode.ExtensionContext): { venvD
 export function checkExtensionVenv(context: vscode.ExtensionContext): VenvStatus {
   const { venvDir, pythonPath } = getExtensionVenvPaths(context);
 
-  const venvExists = exists(venvDir);
+  // The interpreter lives inside the venv directory, so finding it proves the venv exists too.
   const pythonExists = exists(pythonPath);
+  const venvExists = pythonExists || exists(venvDir);
 
   return { venvDir, pythonPath, venvExists, pythonExists };
 }
\ No newline at end of file
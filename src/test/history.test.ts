@@ -0,0 +1,65 @@
+import * as assert from 'assert';
+import fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import {
+  getGlobalHistoryPath,
+  getWorkspaceHistoryPath,
+  persistHistoryAfterRun,
+  prepareHistoryForRun,
+} from '../python/history';
+
+suite('history', () => {
+  let tempRoot: string;
+  let workspaceRoot: string;
+  let globalStoragePath: string;
+  const originalRenameSync = fs.renameSync;
+
+  setup(() => {
+    tempRoot = fs.mkdtempSync(path.join(os.tmpdir(), 'pygreensense-history-'));
+    workspaceRoot = path.join(tempRoot, 'workspace');
+    globalStoragePath = path.join(tempRoot, 'global');
+    fs.mkdirSync(workspaceRoot);
+  });
+
+  teardown(() => {
+    fs.renameSync = originalRenameSync;
+    fs.rmSync(tempRoot, { recursive: true, force: true });
+  });
+
+  test('leaves everything untouched when no history file exists', () => {
+    prepareHistoryForRun(workspaceRoot, globalStoragePath);
+    assert.strictEqual(fs.existsSync(getWorkspaceHistoryPath(workspaceRoot)), false);
+
+    assert.strictEqual(persistHistoryAfterRun(workspaceRoot, globalStoragePath), null);
+    assert.strictEqual(fs.existsSync(getGlobalHistoryPath(globalStoragePath)), false);
+  });
+
+  test('copies global history in and moves it back out after a run', () => {
+    const globalHistoryPath = getGlobalHistoryPath(globalStoragePath);
+    const workspaceHistoryPath = getWorkspaceHistoryPath(workspaceRoot);
+    fs.mkdirSync(globalStoragePath);
+    fs.writeFileSync(globalHistoryPath, '[{"id":1}]');
+
+    prepareHistoryForRun(workspaceRoot, globalStoragePath);
+    assert.strictEqual(fs.readFileSync(workspaceHistoryPath, 'utf8'), '[{"id":1}]');
+
+    fs.writeFileSync(workspaceHistoryPath, '[{"id":1},{"id":2}]');
+    assert.strictEqual(persistHistoryAfterRun(workspaceRoot, globalStoragePath), globalHistoryPath);
+    assert.strictEqual(fs.readFileSync(globalHistoryPath, 'utf8'), '[{"id":1},{"id":2}]');
+    assert.strictEqual(fs.existsSync(workspaceHistoryPath), false);
+  });
+
+  test('falls back to copy and delete when rename crosses devices', () => {
+    const globalHistoryPath = getGlobalHistoryPath(globalStoragePath);
+    const workspaceHistoryPath = getWorkspaceHistoryPath(workspaceRoot);
+    fs.writeFileSync(workspaceHistoryPath, '[{"id":3}]');
+    fs.renameSync = () => {
+      throw Object.assign(new Error('cross-device link not permitted'), { code: 'EXDEV' });
+    };
+
+    assert.strictEqual(persistHistoryAfterRun(workspaceRoot, globalStoragePath), globalHistoryPath);
+    assert.strictEqual(fs.readFileSync(globalHistoryPath, 'utf8'), '[{"id":3}]');
+    assert.strictEqual(fs.existsSync(workspaceHistoryPath), false);
+  });
+});
@@ -1,5 +1,5 @@
 import * as assert from 'assert';
-import { parsePyGreenSenseReport } from '../webview/reportParser';
+import { getRuleSeverity, parsePyGreenSenseReport } from '../webview/reportParser';
 
 suite('reportParser', () => {
   test('parses issue groups, metrics, and program output', () => {
@@ -87,4 +87,32 @@ Paying employee Louis a monthly salary of $5000.
     assert.ok(duplicatedCode);
     assert.strictEqual(duplicatedCode?.count, 2);
   });
+
+  test('parses CRLF output from Windows', () => {
+    const parsed = parsePyGreenSenseReport([
+      '📄 C:\\project\\example.py (1 issue(s))',
+      '  LongMethod (1 issue(s)):',
+      '    Line 12: Method is too long.',
+      '  Region: bangkok',
+      '',
+    ].join('\r\n'));
+
+    assert.strictEqual(parsed.region, 'bangkok');
+    assert.strictEqual(parsed.issueGroups.length, 1);
+    assert.strictEqual(parsed.issueGroups[0].rule, 'LongMethod');
+    assert.deepStrictEqual(parsed.issueGroups[0].issues[0], {
+      filePath: 'C:\\project\\example.py',
+      line: 12,
+      message: 'Method is too long.',
+    });
+  });
+
+  test('ranks rule severity by name before count', () => {
+    assert.strictEqual(getRuleSeverity('God Class', 0), 'danger');
+    assert.strictEqual(getRuleSeverity('mutable_default_arguments', 5), 'low');
+    assert.strictEqual(getRuleSeverity('CustomRule', 0), 'good');
+    assert.strictEqual(getRuleSeverity('CustomRule', 1), 'neutral');
+    assert.strictEqual(getRuleSeverity('CustomRule', 2), 'medium');
+    assert.strictEqual(getRuleSeverity('CustomRule', 4), 'danger');
+  });
 });
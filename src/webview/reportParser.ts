@@ -40,27 +40,35 @@ export function parsePyGreenSenseReport(text: string): ParsedReport {
   let currentFile: string | null = null;
   let currentRule: string | null = null;
 
-  for (const line of rawText.split(/\r?\n/)) {
+  // Lines are trimmed below, which also strips the '\r' of CRLF output.
+  for (const line of rawText.split('\n')) {
     const trimmed = line.trim();
     if (!trimmed) {
       continue;
     }
 
-    const fileMatch = trimmed.match(/^📄\s+(.+?)\s+\((\d+)\s+issue\(s\)\)$/u);
+    // Cheap literal checks decide which line shape to try before running a regex.
+    const fileMatch = trimmed.startsWith('📄') && trimmed.match(/^📄\s+(.+?)\s+\((\d+)\s+issue\(s\)\)$/u);
     if (fileMatch) {
       currentFile = fileMatch[1];
       currentRule = null;
       continue;
     }
 
-    const ruleMatch = trimmed.match(/^([A-Za-z][A-Za-z0-9_]+)\s+\((\d+)\s+issue\(s\)\):$/);
+    const ruleMatch = trimmed.endsWith('):') && trimmed.match(/^([A-Za-z][A-Za-z0-9_]+)\s+\((\d+)\s+issue\(s\)\):$/);
     if (ruleMatch) {
       currentRule = ruleMatch[1];
       ensureGroup(groupMap, groupOrder, currentRule, Number(ruleMatch[2]));
       continue;
     }
 
-    const issueMatch = trimmed.match(/^Line\s+(\d+):\s+(.+)$/);
+    const summaryMatch = trimmed.includes('issue(s)') && trimmed.match(/^([A-Za-z][A-Za-z0-9_]+):\s+(\d+)\s+issue\(s\)/);
+    if (summaryMatch) {
+      ensureGroup(groupMap, groupOrder, summaryMatch[1], Number(summaryMatch[2]));
+      continue;
+    }
+
+    const issueMatch = trimmed.startsWith('Line') && trimmed.match(/^Line\s+(\d+):\s+(.+)$/);
     if (issueMatch && currentRule) {
       const group = ensureGroup(groupMap, groupOrder, currentRule, 0);
       group.issues.push({
@@ -71,13 +79,6 @@ export function parsePyGreenSenseReport(text: string): ParsedReport {
     }
   }
 
-  const summaryMatches = rawText.matchAll(/^\s*([A-Za-z][A-Za-z0-9_]+):\s+(\d+)\s+issue\(s\)/gm);
-  for (const match of summaryMatches) {
-    const rule = match[1];
-    const count = Number(match[2]);
-    ensureGroup(groupMap, groupOrder, rule, count);
-  }
-
   const issueGroups = groupOrder
     .map((rule) => {
       const group = groupMap.get(rule);
@@ -146,7 +147,7 @@ function extractProgramOutput(text: string): string[] {
   }
 
   return match[1]
-    .split(/\r?\n/)
+    .split('\n')
     .map(line => line.trim())
     .filter(line => line.length > 0);
 }
@@ -176,8 +177,12 @@ function extractText(text: string, regex: RegExp): string | null {
   return value.length > 0 ? value : null;
 }
 
-function getRuleSeverity(rule: string, count: number): ParsedSeverity {
-  const normalized = rule.replace(/[\s_-]+/g, '').toLowerCase();
+export function normalizeRule(rule: string): string {
+  return rule.replace(/[\s_-]+/g, '').toLowerCase();
+}
+
+export function getRuleSeverity(rule: string, count: number): ParsedSeverity {
+  const normalized = normalizeRule(rule);
 
   if (normalized.includes('godclass') || normalized.includes('deadcode') || normalized.includes('leak')) {
     return 'danger';
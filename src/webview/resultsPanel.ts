@@ -10,6 +10,8 @@ import {
 } from '../python/history';
 import type { RunResult } from '../python/pythonRunner';
 import {
+  getRuleSeverity,
+  normalizeRule,
   parsePyGreenSenseReport,
   type ParsedIssue,
   type ParsedIssueGroup,
@@ -1185,32 +1187,6 @@ function isPromptMessage(message: unknown): message is PromptMessage {
   return candidate.type === 'copyPrompt' && typeof candidate.prompt === 'string';
 }
 
-function getRuleSeverity(rule: string, count: number): ParsedSeverity {
-  const normalized = normalizeRule(rule);
-
-  if (normalized.includes('godclass') || normalized.includes('deadcode') || normalized.includes('leak')) {
-    return 'danger';
-  }
-
-  if (normalized.includes('duplicated') || normalized.includes('longmethod') || normalized.includes('complex')) {
-    return 'medium';
-  }
-
-  if (normalized.includes('mutabledefault') || normalized.includes('style') || normalized.includes('naming')) {
-    return 'low';
-  }
-
-  if (count >= 4) {
-    return 'danger';
-  }
-
-  if (count >= 2) {
-    return 'medium';
-  }
-
-  return count === 0 ? 'good' : 'neutral';
-}
-
 function getStatusTone(status: string, runCode: number): ParsedSeverity {
   if (runCode !== 0) {
     return 'danger';
@@ -1315,10 +1291,6 @@ function truncateCloudLabel(label: string): string {
   return label.length > 14 ? `${label.slice(0, 11)}...` : label;
 }
 
-function normalizeRule(rule: string): string {
-  return rule.replace(/[\s_-]+/g, '').toLowerCase();
-}
-
 function formatDate(value: string | null): string {
   if (!value) {
     return 'Unknown time';